@@ -1,12 +1,18 @@
 #!/usr/bin/env python3
-import base64, requests, json, re, os, time, random, argparse
-from bs4 import BeautifulSoup
+import base64, requests, re, os, time, argparse
+import orjson
+import lxml.etree, lxml.html
+from lxml.cssselect import CSSSelector
 from urllib.parse import urljoin, urlparse
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import pad, unpad
+from urllib3.util.retry import Retry
+from cryptography.hazmat.primitives import padding
+from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from bidi.algorithm import get_display
 import sys
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
 
 # Add this near the top of your script
 def raw_text(text):
@@ -15,6 +21,8 @@ def raw_text(text):
 
 # Setup print for bidirectional text and constants
 original_print, print = print, lambda *args, **kwargs: original_print(*[get_display(arg) if isinstance(arg, str) else arg for arg in args], **kwargs)
+# Logging skips the bidi pass, keep print for what the user reads (menus, results)
+def log(*args, **kwargs): original_print(*args, **kwargs)
 BASE_URL = "https://www.mako.co.il"
 HEADERS = {
     'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36',
@@ -28,11 +36,22 @@ CRYPTO = {
     'entitlement': {'key': b"YhnUaXMmltB6gd8p9SWleQ==", 'iv': b"theExact16Chars=", 
                    'url': "https://mass.mako.co.il/ClicksStatistics/entitlementsServicesV2.jsp?et=egt"}
 }
+_GUID_RE = re.compile(r'/VOD-([\w-]+)\.htm')
+_QS_GUID_RE = re.compile(r'[?&](guid|videoGuid)=([\w-]+)', re.I)
+# Keys are used as their literal 24 ASCII bytes (AES-192), same as crypto.js.
+# Each key/IV pair is fixed, so build the Cipher once and take a fresh context per call
+_CIPHERS = {t: Cipher(algorithms.AES(c['key']), modes.CBC(c['iv'])) for t, c in CRYPTO.items()}
+_PKCS7 = padding.PKCS7(algorithms.AES.block_size)
 CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "mako_shows_cache.json")
+CACHE_DELTA = CACHE_FILE + '.delta.jsonl'  # Append-only log of entries added since the last full save
 CACHE_TTL = 30 * 24 * 60 * 60  # 30 days in seconds
-DELAY_BETWEEN_REQUESTS = 1
+CRAWL_RPS = 2  # Request rate for the show name crawl, interactive calls aren't limited
 MAX_RETRIES = 3
+POOL_SIZE = 32  # Keep-alive connections per host
 REQUEST_TIMEOUT = 10
+HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')  # Pages are parsed from raw bytes, mako serves UTF-8
+SCRIPT_PARSER = lxml.etree.HTMLParser(encoding='utf-8')  # Plain elements, enough for pulling script text
+MAX_WORKERS = 12  # Concurrent show page fetches
 
 # Parse command line arguments
 def parse_args():
@@ -44,50 +63,87 @@ def parse_args():
 
 # Simple session management
 session = requests.Session()
-adapter = requests.adapters.HTTPAdapter(max_retries=MAX_RETRIES)
+session.headers.update(HEADERS)
+adapter = requests.adapters.HTTPAdapter(
+    pool_connections=POOL_SIZE, pool_maxsize=POOL_SIZE,
+    max_retries=Retry(total=MAX_RETRIES, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]))
 session.mount('http://', adapter)
 session.mount('https://', adapter)
 
-# Core request function
-def request(url, method="GET", headers=None, data=None):
-    # Add delay to prevent throttling
-    time.sleep(DELAY_BETWEEN_REQUESTS + random.uniform(0.5, 1.5))
+# One worker pool and one session for the whole run
+executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+
+# Spaces requests evenly at rps across threads, wait() returns how long to sleep
+class RateLimiter:
+    def __init__(self, rps):
+        self.interval = 1 / rps
+        self.next = 0
+        self.lock = threading.Lock()
+    
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            delay = max(0, self.next - now)
+            self.next = max(now, self.next) + self.interval
+            return delay
+
+crawl_limiter = RateLimiter(CRAWL_RPS)
+
+# Core request function, pass a limiter to throttle bulk fetches
+def request(url, method="GET", headers=None, data=None, limiter=None):
+    if limiter: time.sleep(limiter.wait())
+    
+    log(f"Fetching: {url}")
     
+    # Only network errors raise, status codes are checked below
     try:
-        print(f"Fetching: {url}")
-        req_headers = headers or HEADERS.copy()
-        
+        # Session already carries HEADERS, headers only adds per-call extras
         if method.upper() == "POST":
-            resp = session.post(url, headers=req_headers, data=data, timeout=REQUEST_TIMEOUT)
+            resp = session.post(url, headers=headers, data=data, timeout=REQUEST_TIMEOUT)
         else:
-            resp = session.get(url, headers=req_headers, timeout=REQUEST_TIMEOUT)
-        
-        resp.raise_for_status()
-        return resp
-    except Exception as e:
-        print(f"Request error: {e}")
+            resp = session.get(url, headers=headers, timeout=REQUEST_TIMEOUT)
+    except requests.RequestException as e:
+        log(f"Request error: {e}")
         return None
+    
+    if resp.status_code >= 400:
+        log(f"Request error: {resp.status_code} {resp.reason} for url: {url}")
+        return None
+    return resp
 
-# Encryption/decryption function
+# Encryption/decryption function, bytes in and bytes out (base64 on the wire side)
 def crypto_op(data, op, type):
     try:
-        c = CRYPTO[type]
+        cipher = _CIPHERS[type]
         if op == "decrypt":
-            cipher = AES.new(c['key'], AES.MODE_CBC, c['iv'])
-            return unpad(cipher.decrypt(base64.b64decode(data)), AES.block_size, style='pkcs7').decode('utf-8')
+            decryptor, unpadder = cipher.decryptor(), _PKCS7.unpadder()
+            # b64decode skips the surrounding whitespace, no strip needed
+            padded = decryptor.update(base64.b64decode(data, validate=False)) + decryptor.finalize()
+            return unpadder.update(padded) + unpadder.finalize()
         else:  # encrypt
-            cipher = AES.new(c['key'], AES.MODE_CBC, c['iv'])
-            data_bytes = data.encode('utf-8') if isinstance(data, str) else data
-            return base64.b64encode(cipher.encrypt(pad(data_bytes, AES.block_size, style='pkcs7'))).decode('utf-8')
+            encryptor, padder = cipher.encryptor(), _PKCS7.padder()
+            padded = padder.update(data) + padder.finalize()
+            return base64.b64encode(encryptor.update(padded) + encryptor.finalize())
     except Exception as e:
-        print(f"{op} error: {e}")
+        log(f"{op} error: {e}")
         return None
 
+# Run func over items on the shared pool, yielding results in order
+def fetch_all(func, items):
+    futures = [executor.submit(func, item) for item in items]
+    try:
+        for future in futures:
+            yield future.result()
+    finally:
+        for future in futures: future.cancel()
+
 # Simple select menu
 def select_item(items, prompt):
     if not items: return None
     print(f"\n{prompt}")
-    for i, item in enumerate(items): print(f"{i + 1}. {item['name']}")
+    # Build the menu as one string for a single write. bidi still runs per line,
+    # a joined string would take one base direction for every line
+    original_print('\n'.join(get_display(f"{i + 1}. {item['name']}") for i, item in enumerate(items)))
     try: return items[int(input(f"Choice (1-{len(items)}): ")) - 1]
     except: return None
 
@@ -95,58 +151,106 @@ def select_item(items, prompt):
 def load_cache():
     try:
         if os.path.exists(CACHE_FILE):
-            with open(CACHE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {"timestamp": time.time(), "shows": {}}
+            with open(CACHE_FILE, 'rb') as f:
+                cache = orjson.loads(f.read())
+        else:
+            cache = {"timestamp": time.time(), "shows": {}}
     except Exception as e:
-        print(f"Error loading cache: {e}")
-        return {"timestamp": time.time(), "shows": {}}
+        log(f"Error loading cache: {e}")
+        cache = {"timestamp": time.time(), "shows": {}}
+    
+    # Replay entries logged since the last full save
+    try:
+        if os.path.exists(CACHE_DELTA):
+            with open(CACHE_DELTA, 'rb') as f:
+                for line in f:
+                    try: record = orjson.loads(line)
+                    except orjson.JSONDecodeError: continue  # Torn final line from an interrupted run
+                    # Skip anything that isn't an entry record instead of dropping the rest
+                    if not isinstance(record, dict) or not isinstance(url := record.pop('url', None), str): continue
+                    old = cache["shows"].get(url)
+                    cache["shows"][url] = {**old, **record} if isinstance(old, dict) else record
+    except Exception as e:
+        log(f"Error loading cache delta: {e}")
+    return cache
+
+def append_cache_delta(f, url, entry):
+    f.write(orjson.dumps({"url": url, **entry}) + b'\n')
+    f.flush()
 
 def save_cache(cache):
+    cache_dir = os.path.dirname(CACHE_FILE)
+    temp_file = os.path.join(cache_dir, f"temp_cache_{int(time.time())}.json")
     try:
-        # Create a temporary file
-        cache_dir = os.path.dirname(CACHE_FILE)
         os.makedirs(cache_dir, exist_ok=True)
-        temp_file = os.path.join(cache_dir, f"temp_cache_{int(time.time())}.json")
+        log(f"Saving {len(cache['shows'])} shows to cache...")
         
-        # Write to temp file with explicit encoding
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            print(f"Saving {len(cache['shows'])} shows to cache...")
-            json.dump(cache, f, ensure_ascii=False, indent=2)
+        # Serialize once to UTF-8 bytes and write them to the temp file in one go
+        data = memoryview(orjson.dumps(cache, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            while data: data = data[os.write(fd, data):]
+            os.fsync(fd)
+        finally:
+            os.close(fd)
         
         os.replace(temp_file, CACHE_FILE)
-        print("Cache saved successfully")
+        # The full file now holds everything the delta log recorded
+        if os.path.exists(CACHE_DELTA): os.remove(CACHE_DELTA)
+        log("Cache saved successfully")
     except Exception as e:
-        print(f"Error saving cache: {e}")
+        log(f"Error saving cache: {e}")
         if os.path.exists(temp_file):
             try: os.remove(temp_file)
             except: pass
 
+# Embedded JSON scripts, plain str results so orjson accepts them
+_JSONLD_XPATH = lxml.etree.XPath('string((//script[@type="application/ld+json"])[1])', smart_strings=False)
+_NEXT_DATA_XPATH = lxml.etree.XPath('string(//script[@id="__NEXT_DATA__"])', smart_strings=False)
+
+def script_text(resp, xpath):
+    root = lxml.etree.fromstring(resp.content, SCRIPT_PARSER)
+    return xpath(root) if root is not None else ''
+
+# Cache entries are {"name", "etag", "last_modified"}, older caches stored the bare name
+def cached_name(entry):
+    return entry.get('name') if isinstance(entry, dict) else entry
+
 # Show name extraction
-def extract_show_name(url):
-    resp = request(url)
+def _fetch_show(url, entry=None):
+    """Fetch a show page and return its cache entry, revalidating a cached one"""
+    headers = {}
+    if isinstance(entry, dict) and cached_name(entry):
+        if entry.get('etag'): headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'): headers['If-Modified-Since'] = entry['last_modified']
+    
+    resp = request(url, headers=headers or None, limiter=crawl_limiter)
     if not resp: return None
     
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    jsonld_tag = soup.find('script', type='application/ld+json')
+    # Page unchanged since the cached copy, keep the cached name
+    if resp.status_code == 304:
+        log(f"Not modified: {url}")
+        return {'name': entry['name'], 'etag': entry.get('etag'), 'last_modified': entry.get('last_modified')}
+    
+    jsonld = script_text(resp, _JSONLD_XPATH)
     
-    if not jsonld_tag:
+    if not jsonld:
         return None
         
     try:
         # Parse the JSON-LD data
-        data = json.loads(jsonld_tag.string)
+        data = orjson.loads(jsonld)
         
         # IMPORTANT FIX: Check if this is a TVSeason and get the series name instead
         if data.get('@type') == 'TVSeason' and 'partOfTVSeries' in data:
             name = data['partOfTVSeries'].get('name')
-            print(f"Found TVSeason, using series name from partOfTVSeries: {name}")
+            log(f"Found TVSeason, using series name from partOfTVSeries: {name}")
         else:
             # Regular TVSeries handling
             name = data.get('name')
         
         # For debugging, print the raw name exactly as found in JSON
-        print(f"Raw name found in JSON: {name}")
+        log(f"Raw name found in JSON: {name}")
         
         # Optional: Add season info if available
         if "containsSeason" in data and data["containsSeason"]:
@@ -155,14 +259,23 @@ def extract_show_name(url):
                 if seasons_count > 1:
                     name = f"{name} ({seasons_count} עונות)"
         
-        return name
+        if not name: return None
+        return {'name': name, 'etag': resp.headers.get('ETag'), 'last_modified': resp.headers.get('Last-Modified')}
     except Exception as e:
-        print(f"Error extracting show name from {url}: {e}")
+        log(f"Error extracting show name from {url}: {e}")
         traceback.print_exc()  # Print full traceback for debugging
         return None
 
-# Process show names (simplified version without threading)
-def process_show_names(shows, cache, cache_is_fresh, max_shows=None):
+# Worker wrapper so one bad page can't stop the whole crawl
+def _fetch_show_safe(url, entry=None):
+    try:
+        return _fetch_show(url, entry)
+    except Exception as e:
+        log(f"Error fetching show name from {url}: {e}")
+        return None
+
+# Process show names concurrently
+def process_show_names(shows, cache, max_shows=None):
     updates_count = 0
     processed_count = 0
     
@@ -170,160 +283,173 @@ def process_show_names(shows, cache, cache_is_fresh, max_shows=None):
     shows_to_process = shows
     if max_shows and max_shows < len(shows):
         shows_to_process = shows[:max_shows]
-        print(f"Will process only {max_shows} shows")
+        log(f"Will process only {max_shows} shows")
+    
+    # extract_content already applied fresh cached names, every show here needs fetching
+    pending = shows_to_process
     
     total = len(shows_to_process)
-    print(f"Processing {total} shows...")
+    log(f"Processing {total} shows...")
     
-    # Process each show sequentially
-    for i, show in enumerate(shows_to_process):
-        try:
+    dirty = False
+    
+    # New entries go to the delta log as they arrive, the full cache is
+    # only rewritten (compacted) once at the end
+    def compact():
+        if not dirty: return
+        cache["timestamp"] = time.time()
+        save_cache(cache)
+    
+    # Fetch the remaining names through the worker pool so network waits overlap,
+    # passing stale entries along so unchanged pages come back as 304s
+    delta = None
+    try:
+        urls = [show['url'] for show in pending]
+        results = fetch_all(lambda url: _fetch_show_safe(url, cache["shows"].get(url)), urls)
+        for show, result in zip(pending, results):
             url = show['url']
-            
-            # Check if in cache
-            if url in cache["shows"] and cache_is_fresh:
-                show['name'] = cache["shows"][url]
-                processed_count += 1
-                continue
-                
-            # Not in cache, fetch the name
-            if correct_name := extract_show_name(url):
-                print(f"Found show name: {correct_name}")
-                # Debugging for Hebrew text issues
-                print(f"Raw bytes: {correct_name.encode('utf-8')}")
-                show['name'] = correct_name
-                cache["shows"][url] = correct_name
-            else:
-                print(f"Could not fetch name for show at {url}")
+            try:
+                if result:
+                    correct_name = result['name']
+                    log(f"Found show name: {correct_name}")
+                    # Debugging for Hebrew text issues
+                    log(f"Raw bytes: {correct_name.encode('utf-8')}")
+                    show['name'] = correct_name
+                    # Only this thread writes the cache, workers just read entries
+                    old = cache["shows"].get(url)
+                    # Keep any other fields stored on the entry
+                    entry = dict(old) if isinstance(old, dict) else {}
+                    entry.update((k, v) for k, v in result.items() if v)
+                    cache["shows"][url] = entry
+                    # Open the delta log on the first entry so failed crawls leave no file
+                    if delta is None: delta = open(CACHE_DELTA, 'ab')
+                    append_cache_delta(delta, url, entry)
+                    dirty = True
+                    if correct_name != cached_name(old): updates_count += 1
+                else:
+                    log(f"Could not fetch name for show at {url}")
+            except Exception as e:
+                log(f"Error processing show at {url}: {e}")
             
             # Update progress
             processed_count += 1
-            print(f"Progress: {processed_count}/{total} shows processed ({processed_count/total*100:.1f}%)")
-            
-            # Save after every 10 updates or at the end
-            if updates_count % 10 == 0 or i == len(shows_to_process) - 1:
-                cache["timestamp"] = time.time()
-                save_cache(cache)
-                
-        except KeyboardInterrupt:
-            print("\nProcess interrupted. Saving progress...")
-            cache["timestamp"] = time.time()
-            save_cache(cache)
-            return updates_count
-        except Exception as e:
-            print(f"Error processing show {show.get('name', 'unknown')}: {e}")
-    
+            log(f"Progress: {processed_count}/{total} shows processed ({processed_count/total*100:.1f}%)")
+    except KeyboardInterrupt:
+        log("\nProcess interrupted. Saving progress...")
+        if delta: delta.close()
+        compact()
+        return updates_count
+    except Exception as e:
+        log(f"Error processing shows: {e}")
+
+    if delta: delta.close()
+    compact()
     return updates_count
 
-# Content extraction
-def extract_content(url, content_type):
+# Listing selectors per content type, tried in order until one matches
+SELECTORS = {
+    'shows': ['li > a[href^="/mako-vod-"]', 'li a[href^="/mako-vod-"]'],
+    'seasons': ['div#seasonDropdown ul ul li a'],
+    'episodes': ['li.card a', 'a[href*="videoGuid="]', '.vod_item a', '.vod_item_wrap a']
+}
+_SEASON_NAME = CSSSelector('span')
+_EPISODE_TITLE = CSSSelector('strong.title')
+
+def _text(elem, selector):
+    matches = selector(elem)
+    return matches[0].text_content().strip() if matches else ''
+
+def _extract_shows(elements):
+    items, seen = [], set()
+    for a in elements:
+        href = a.get('href')
+        if not href: continue
+        url = urljoin(BASE_URL, href)
+        if url in seen: continue
+        seen.add(url)
+        img = a.find('.//img')
+        name = img.get('alt') if img is not None else None
+        items.append({'url': url, 'name': name or 'Unknown Show'})  # Temporary name
+    return items
+
+def _extract_seasons(elements, base):
+    items, seen = [], set()
+    for a in elements:
+        href, name = a.get('href'), _text(a, _SEASON_NAME)
+        if not (href and name): continue
+        url = urljoin(base, href)
+        if url in seen: continue
+        seen.add(url)
+        items.append({'name': name, 'url': url})
+    return items
+
+def _extract_episodes(elements, base):
+    items, seen = [], set()
+    for a in elements:
+        href, name = a.get('href'), _text(a, _EPISODE_TITLE)
+        if not (href and name): continue
+        if match := _GUID_RE.search(href): guid = match.group(1)
+        elif match := _QS_GUID_RE.search(href): guid = match.group(2)
+        else: guid = href
+        if guid in seen: continue
+        seen.add(guid)
+        items.append({'name': name, 'url': urljoin(base, href), 'guid': guid})
+    return items
+
+# Content extraction, ctx (args + cache, built once in main) is needed for shows
+def extract_content(url, content_type, ctx=None):
     resp = request(url)
     if not resp: return []
     
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    configs = {
-        'shows': {
-            'selectors': ['li > a[href^="/mako-vod-"]', 'li a[href^="/mako-vod-"]'],
-            'fields': {'url': {'attribute': 'href'}, 'temp_name': {'selector': 'img', 'attribute': 'alt'}},
-            'base': BASE_URL
-        },
-        'seasons': {
-            'selectors': ['div#seasonDropdown ul ul li a'],
-            'fields': {'name': {'selector': 'span'}, 'url': {'attribute': 'href'}},
-            'base': url
-        },
-        'episodes': {
-            'selectors': ['li.card a', 'a[href*="videoGuid="]', '.vod_item a', '.vod_item_wrap a'],
-            'fields': {'name': {'selector': 'strong.title'}, 'url': {'attribute': 'href'}, 
-                      'guid': {'attribute': 'href', 'regex': r'/VOD-([\w-]+)\.htm'}},
-            'base': url
-        }
-    }
-    
-    config = configs[content_type]
-    items, seen = [], set()
+    # An empty body has no document to parse, treat it as no items
+    try:
+        root = lxml.html.fromstring(resp.content, parser=HTML_PARSER)
+    except lxml.etree.ParserError:
+        log(f"Empty page: {url}")
+        return []
     
     # Find elements using selectors
     elements = []
-    for selector in config['selectors']:
-        if elements := soup.select(selector): break
+    for selector in SELECTORS[content_type]:
+        if elements := root.cssselect(selector): break
     
-    print(f"Found {len(elements)} {content_type}")
+    log(f"Found {len(elements)} {content_type}")
     
-    # Process each element
-    for elem in elements:
-        item = {}
-        for field, field_config in config['fields'].items():
-            selector = field_config.get('selector')
-            attr = field_config.get('attribute')
-            regex = field_config.get('regex')
-            
-            target = elem.select_one(selector) if selector else elem
-            if not target: continue
-            
-            value = target.get(attr, '') if attr else target.text.strip()
-            
-            if value and regex and field == 'guid' and (match := re.search(regex, value)):
-                value = match.group(1)
-            
-            if value and field == 'url':
-                value = urljoin(config['base'], value)
-                
-            if value: item[field] = value
-        
-        if len(item) == len(config['fields']) or (content_type == 'shows' and 'url' in item):
-            key = item.get('guid', item.get('url', ''))
-            if key and key not in seen:
-                if content_type == 'shows':
-                    item['name'] = item.pop('temp_name', 'Unknown Show')  # Temporary name
-                items.append(item)
-                seen.add(key)
-    
-    # Special handling for episodes
-    if content_type == 'episodes':
-        for ep in items:
-            if 'guid' not in ep and 'url' in ep:
-                if match := re.search(r'[?&](guid|videoGuid)=([\w-]+)', ep['url'], re.I):
-                    ep['guid'] = match.group(2)
-        items = [ep for ep in items if 'guid' in ep]
+    if content_type == 'shows':
+        items = _extract_shows(elements)
+    elif content_type == 'seasons':
+        items = _extract_seasons(elements, url)
+    else:
+        items = _extract_episodes(elements, url)
     
     # Special handling for shows to get correct names
     if content_type == 'shows':
-        args = parse_args()
-        cache = load_cache()
-        cache_is_fresh = time.time() - cache.get("timestamp", 0) < CACHE_TTL
+        args, cache, cache_is_fresh = ctx.args, ctx.cache, ctx.cache_is_fresh
+        cached_shows = cache["shows"]
+        
+        # Apply cached names and collect the rest in a single pass
+        to_fetch = []
+        for show in items:
+            name = cached_name(cached_shows.get(show['url'])) if cache_is_fresh else None
+            if name: show['name'] = name
+            else: to_fetch.append(show)
         
         if args.skip_name_fetch:
-            print("\nSkipping show name fetching as requested")
-            # Just load names from cache
-            if cache_is_fresh:
-                for show in items:
-                    if show['url'] in cache["shows"]:
-                        show['name'] = cache["shows"][show['url']]
+            log("\nSkipping show name fetching as requested")
         else:
-            print(f"\nLoading accurate show names...")
-            
-            # Apply cached names first
-            cached_count = 0
-            if cache_is_fresh:
-                for show in items:
-                    if show['url'] in cache["shows"]:
-                        show['name'] = cache["shows"][show['url']]
-                        cached_count += 1
+            log(f"\nLoading accurate show names...")
             
-            if cached_count:
-                print(f"Using {cached_count} show names from cache")
+            if cached_count := len(items) - len(to_fetch):
+                log(f"Using {cached_count} show names from cache")
             
-            # Determine which shows need to be fetched
-            to_fetch = [show for show in items if not (cache_is_fresh and show['url'] in cache["shows"])]
             if not to_fetch:
-                print("All show names already in cache!")
+                log("All show names already in cache!")
             else:
-                print(f"Need to fetch {len(to_fetch)} show names")
-                updates = process_show_names(to_fetch, cache, cache_is_fresh, args.max_shows)
+                log(f"Need to fetch {len(to_fetch)} show names")
+                updates = process_show_names(to_fetch, cache, args.max_shows)
                 
                 if updates > 0:
-                    print(f"Added {updates} new show names to cache")
+                    log(f"Added {updates} new show names to cache")
     
     return items
 
@@ -332,12 +458,11 @@ def get_episode_details(url):
     resp = request(url)
     if not resp: return None
     
-    soup = BeautifulSoup(resp.text, 'html.parser')
-    script = soup.find('script', id='__NEXT_DATA__')
+    script = script_text(resp, _NEXT_DATA_XPATH)
     if not script: return None
     
     try:
-        data = json.loads(script.string)
+        data = orjson.loads(script)
         vod = data.get('props', {}).get('pageProps', {}).get('data', {}).get('vod', {})
         
         details = {
@@ -362,31 +487,31 @@ def get_video_url(episode_url):
                f"&consumer=responsive")
     
     resp = request(ajax_url)
-    if not resp or not resp.text.strip(): return None
+    if not resp or not resp.content.strip(): return None
     
     try:
-        decrypted = crypto_op(resp.text.strip(), "decrypt", "playlist")
+        decrypted = crypto_op(resp.content, "decrypt", "playlist")
         if not decrypted: return None
         
-        data = json.loads(decrypted)
+        data = orjson.loads(decrypted)
         media = data.get('media', [])
         hls_url = media[0].get('url') if media and isinstance(media[0], dict) else None
         if not hls_url: return None
         
         # Get entitlement ticket
-        payload = json.dumps({"lp": urlparse(hls_url).path, "rv": "AKAMAI"}, separators=(',', ':'))
+        payload = orjson.dumps({"lp": urlparse(hls_url).path, "rv": "AKAMAI"})
         encrypted = crypto_op(payload, "encrypt", "entitlement")
         
         resp = request(CRYPTO['entitlement']['url'], "POST", 
-                      {**HEADERS, 'Content-Type': 'text/plain;charset=UTF-8'}, encrypted)
+                      {'Content-Type': 'text/plain;charset=UTF-8'}, encrypted)
         
         # Return base URL if ticket fails
         if not resp: return hls_url
         
-        decrypted = crypto_op(resp.text.strip(), "decrypt", "entitlement")
+        decrypted = crypto_op(resp.content, "decrypt", "entitlement")
         if not decrypted: return hls_url
         
-        data = json.loads(decrypted)
+        data = orjson.loads(decrypted)
         tickets = data.get('tickets', [])
         if tickets and isinstance(tickets[0], dict) and (ticket := tickets[0].get('ticket')):
             separator = '&' if '?' in hls_url else '?'
@@ -394,24 +519,27 @@ def get_video_url(episode_url):
         return hls_url
             
     except Exception as e:
-        print(f"Error processing video URL: {e}")
+        log(f"Error processing video URL: {e}")
         return None
 
 # Main function
 def main():
     args = parse_args()
+    cache = load_cache()
+    ctx = SimpleNamespace(args=args, cache=cache,
+                          cache_is_fresh=time.time() - cache.get("timestamp", 0) < CACHE_TTL)
     
     try:
         # Update mode - just process show names then exit
         if args.update_mode:
             print("Running in update mode - will only update show name cache")
-            shows = extract_content(f"{BASE_URL}/mako-vod-index", 'shows')
+            shows = extract_content(f"{BASE_URL}/mako-vod-index", 'shows', ctx)
             if shows:
                 print("Shows cache update complete. Exiting.")
             return
         
         # Regular mode - select and play video
-        shows = extract_content(f"{BASE_URL}/mako-vod-index", 'shows')
+        shows = extract_content(f"{BASE_URL}/mako-vod-index", 'shows', ctx)
         if not shows:
             print("No shows found. Exiting.")
             return
@@ -449,6 +577,8 @@ def main():
         print("\nUnexpected error")
         print(e)
         traceback.print_exc()
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file